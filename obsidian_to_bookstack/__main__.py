@@ -1,6 +1,7 @@
 import click
 
 from .bookstack.bookstack import Bookstack, BookstackItems
+from .bookstack.constants import MAX_CONCURRENT_UPLOADS, MAX_WORKERS
 from .config import load_env, load_toml
 from .console import console
 from .sqllite import DatabaseFunctions as dbf
@@ -20,6 +21,26 @@ def cli(ctx, verbose, config="", env=""):
 
     path = toml["wiki"]["path"]
     excluded = toml["wiki"]["excluded"]["shelves"]
+    max_concurrent_uploads = toml["wiki"].get(
+        "max_concurrent_uploads", MAX_CONCURRENT_UPLOADS
+    )
+
+    # bool is a subclass of int, but `true` is never a sensible limit
+    if (
+        not isinstance(max_concurrent_uploads, int)
+        or isinstance(max_concurrent_uploads, bool)
+        or max_concurrent_uploads < 1
+    ):
+        raise click.BadParameter(
+            f"must be a positive integer, got {max_concurrent_uploads!r}",
+            param_hint="`wiki.max_concurrent_uploads`",
+        )
+
+    # uploads run on the client's worker threads, so they can't exceed its size
+    if max_concurrent_uploads > MAX_WORKERS:
+        console.log(
+            f"[bold yellow]Warning:[/bold yellow] `wiki.max_concurrent_uploads` is capped at {MAX_WORKERS}, got {max_concurrent_uploads}."
+        )
 
     console.log(f"Looking at Obsidian Vault at: [bold blue]{path}[/bold blue]")
 
@@ -27,7 +48,12 @@ def cli(ctx, verbose, config="", env=""):
         console.log(f"Excluding shelves: [bold blue]{excluded}[/bold blue]")
 
     with console.status("Building client..."):
-        b = Bookstack(path, excluded, verbose=verbose)
+        b = Bookstack(
+            path,
+            excluded,
+            verbose=verbose,
+            max_concurrent_uploads=max_concurrent_uploads,
+        )
         ctx.obj = {"bookstack": b}
 
 
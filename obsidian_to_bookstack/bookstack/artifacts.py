@@ -1,4 +1,6 @@
 import os
+import sys
+from functools import cached_property
 from typing import Dict, List
 
 from .client import Client
@@ -11,39 +13,49 @@ class Shelf:
         client: Client | None = None,
         from_client: bool = True,
         path: str = "",
-        details: Dict = {},
+        details: Dict | None = None,
+        scan_books: bool = True,
     ) -> None:
         self.path = path
-        self.name = name
+        self.name = sys.intern(name)
         self.client = client
-        if from_client:
+        # scan_books=False leaves a local shelf's books for the caller to fill in
+        if from_client or not scan_books:
             self.books = []
         else:
             self.books = self._set_books()
         self.client_books: list[dict] = []
-        self.details = details
+        self.details = {} if details is None else details
 
     def __str__(self) -> str:
         return self.name
 
     def _set_books(self):
-        books = []
-        for book in os.listdir(self.path):
-            if os.path.isdir(os.path.join(self.path, book)) and not book.startswith(
-                "."
-            ):
-                b = Book(
-                    path=os.path.join(self.path, book),
-                    name=book,
-                    client=self.client,
-                    shelf=self,
-                    from_client=False,
-                )
-                books.append(b)
-
-        return books
-
-    def get_full_path_str(self) -> str:
+        return [self._build_book(entry) for entry in self._book_entries()]
+
+    def _book_entries(self) -> List[os.DirEntry]:
+        """Directory entries of the shelf's books, without scanning inside them"""
+        with os.scandir(self.path) as entries:
+            return [
+                entry
+                for entry in entries
+                if entry.is_dir() and not entry.name.startswith(".")
+            ]
+
+    def _build_book(self, entry: os.DirEntry) -> "Book":
+        return Book(
+            path=entry.path,
+            name=entry.name,
+            client=self.client,
+            shelf=self,
+            from_client=False,
+        )
+
+    @cached_property
+    def full_path_str(self) -> str:
+        """Path of the item within the vault, cached on first access, so it must not be
+        read before the item is linked to its parents (remote books get their shelf
+        in get_books, remote pages their chapter in get_chapters)"""
         return self.name
 
 
@@ -53,17 +65,17 @@ class Book:
         name: str,
         shelf: Shelf | None = None,
         client: Client | None = None,
-        chapters: List = [],
+        chapters: List | None = None,
         path: str = "",
-        details: Dict = {},
+        details: Dict | None = None,
         from_client: bool = True,
     ) -> None:
         self.path = path
-        self.name = name
+        self.name = sys.intern(name)
         self.client = client
         self.shelf = shelf
-        self.chapters = chapters
-        self.details = details
+        self.chapters = [] if chapters is None else chapters
+        self.details = {} if details is None else details
         if from_client:
             self.pages = []
         else:
@@ -76,37 +88,38 @@ class Book:
         pages = []
         chapters = []
 
-        for item in os.listdir(self.path):
-            item_path = os.path.join(self.path, item)
-            if os.path.isdir(item_path):
-                chapters.append(
-                    Chapter(
-                        path=os.path.join(self.path, item),
-                        name=item,
-                        client=self.client,
-                        shelf=self.shelf,
-                        book=self,
-                        from_client=False,
+        with os.scandir(self.path) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    chapters.append(
+                        Chapter(
+                            path=entry.path,
+                            name=entry.name,
+                            client=self.client,
+                            shelf=self.shelf,
+                            book=self,
+                            from_client=False,
+                        )
                     )
-                )
-            else:
-                if os.path.splitext(item)[1] == ".md":
+                elif entry.name.endswith(".md"):
                     pages.append(
                         Page(
-                            path=os.path.join(self.path, item),
-                            name=item,
+                            path=entry.path,
+                            name=entry.name,
                             client=self.client,
                             shelf=self.shelf,
                             book=self,
+                            mtime=entry.stat().st_mtime,
                         )
                     )
 
         self.pages = pages
         self.chapters = chapters
 
-    def get_full_path_str(self) -> str:
+    @cached_property
+    def full_path_str(self) -> str:
         if self.shelf:
-            return os.path.join(self.shelf.get_full_path_str(), self.name)
+            return os.path.join(self.shelf.full_path_str, self.name)
         return self.name
 
 
@@ -118,15 +131,15 @@ class Chapter:
         book: Book | None = None,
         client: Client | None = None,
         path: str = "",
-        details: Dict = {},
+        details: Dict | None = None,
         from_client: bool = True,
     ) -> None:
         self.path = path
-        self.name = name
+        self.name = sys.intern(name)
         self.client = client
         self.shelf = shelf
         self.book = book
-        self.details = details
+        self.details = {} if details is None else details
         if from_client:
             self.pages = []
         else:
@@ -137,22 +150,25 @@ class Chapter:
 
     def _set_pages(self):
         pages = []
-        for page in os.listdir(self.path):
-            if os.path.splitext(page)[1] == ".md":
-                p = Page(
-                    path=os.path.join(self.path, page),
-                    name=page,
-                    client=self.client,
-                    book=self.book,
-                    chapter=self,
-                )
-                pages.append(p)
+        with os.scandir(self.path) as entries:
+            for entry in entries:
+                if entry.name.endswith(".md"):
+                    p = Page(
+                        path=entry.path,
+                        name=entry.name,
+                        client=self.client,
+                        book=self.book,
+                        chapter=self,
+                        mtime=entry.stat().st_mtime,
+                    )
+                    pages.append(p)
 
         self.pages = pages
 
-    def get_full_path_str(self) -> str:
+    @cached_property
+    def full_path_str(self) -> str:
         if self.book:
-            return os.path.join(self.book.get_full_path_str(), self.name)
+            return os.path.join(self.book.full_path_str, self.name)
         return self.name
 
 
@@ -165,28 +181,38 @@ class Page:
         shelf: Shelf | None = None,
         book: Book | None = None,
         chapter: Chapter | None = None,
-        details: Dict = {},
+        details: Dict | None = None,
+        mtime: float = 0.0,
     ) -> None:
         self.path = path
-        self.name = name
+        self.name = sys.intern(name)
+        # name without its extension, as used by Bookstack; remote names have none
+        self.stem = sys.intern(name.removesuffix(".md"))
         self.client = client
-        self.content = self._get_content() if self.path else ""
         self.shelf = shelf
         self.book = book
         self.chapter = chapter
-        self.details = details
+        self.details = {} if details is None else details
+        self.mtime = mtime  # local file modification time, in epoch seconds
+        self.updated_at = 0.0  # remote update time, in epoch seconds
+        self.client_page: Page | None = None  # remote counterpart of a local page
 
     def __str__(self) -> str:
         return self.name
 
+    @cached_property
+    def content(self) -> str:
+        """Contents of the local file, only read on first access"""
+        return self._get_content() if self.path else ""
+
     def _get_content(self):
         with open(self.path, "r") as f:
             return f.read()
 
-    def get_full_path_str(self) -> str:
-        name = os.path.splitext(self.name)[0]
+    @cached_property
+    def full_path_str(self) -> str:
         if self.chapter:
-            return os.path.join(self.chapter.get_full_path_str(), name)
+            return os.path.join(self.chapter.full_path_str, self.stem)
         elif self.book:
-            return os.path.join(self.book.get_full_path_str(), name)
-        return name
+            return os.path.join(self.book.full_path_str, self.stem)
+        return self.stem
@@ -1,12 +1,12 @@
 import os
 import shutil
-from datetime import datetime, timedelta
-from typing import List
-
-import urllib3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List
 
 from ..console import console
-from ..utils import con_hash
+from ..sqllite import DatabaseFunctions as dbf
+from ..utils import to_epoch
 from .artifacts import Book, Chapter, Page, Shelf
 from .client import LocalClient, RemoteClient
 from .collectors.local import *
@@ -35,10 +35,27 @@ class BookstackClient(RemoteClient):
         self.chapter_collector = RemoteChapterCollector(self.verbose, self)
 
     def __set_artifacts(self):
-        self.shelves: List[Shelf] = self.shelf_collector.get_shelves()
-        self.books: List[Book] = self.book_collector.get_books(self.shelves)
-        self.pages: List[Page] = self.page_collector.get_pages(self.books)
-        self.chapters: List[Chapter] = self.chapter_collector.get_chapters(self.books)
+        # fetching doesn't depend on other collectors so all four overlap, but
+        # each collector links its items onto the ones gathered before it; these
+        # threads only wait, their requests all run on the client's MAX_WORKERS pool
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            client_shelves = executor.submit(self.shelf_collector.fetch_shelves)
+            client_books = executor.submit(self.book_collector.fetch_books)
+            client_pages = executor.submit(self.page_collector.fetch_pages)
+            client_chapters = executor.submit(self.chapter_collector.fetch_chapters)
+
+        self.shelves: List[Shelf] = self.shelf_collector.get_shelves(
+            client_shelves.result()
+        )
+        self.books: List[Book] = self.book_collector.get_books(
+            self.shelves, client_books.result()
+        )
+        self.pages: List[Page] = self.page_collector.get_pages(
+            self.books, client_pages.result()
+        )
+        self.chapters: List[Chapter] = self.chapter_collector.get_chapters(
+            self.books, client_chapters.result()
+        )
 
     def __set_maps(self):
         self.shelf_map = self._build_shelf_map()
@@ -47,91 +64,108 @@ class BookstackClient(RemoteClient):
         self.chapter_map = self._build_chapter_map()
 
     def _refresh(self):
-        """Simply update the client"""
-        self.http = urllib3.PoolManager()
+        """Simply update the client, reusing the existing connection pool"""
         self.__set_collectors()
         self.__set_artifacts()
         self.__set_maps()
 
     def _build_shelf_map(self):
         """Build a map of all client shelves"""
-        return {con_hash(shelf.name): shelf for shelf in self.shelves}
+        return {shelf.name: shelf for shelf in self.shelves}
 
     def _build_book_map(self):
-        """Build a map of all client books"""
-        book_map = {}
-        for book in self.books:
-            if book.shelf:
-                book_map[con_hash(book.name + book.shelf.name)] = book
-            else:
-                book_map[con_hash(book.name)] = book
-
-        return book_map
+        """Build a map of all client books, keyed by (name, shelf name)"""
+        return {
+            (book.name, book.shelf.name if book.shelf else None): book
+            for book in self.books
+        }
 
     def _build_page_map(self):
-        """Build a map of all client pages"""
-        page_map = {}
+        """Build a map of all client pages, keyed by (stem, book name, chapter name)"""
         for page in self.pages:
-            if page.chapter and page.book:
-                page_map[
-                    con_hash(page.name + page.book.name + page.chapter.name)
-                ] = page
-
-            elif page.book:
-                page_map[con_hash(page.name + page.book.name)] = page
-
-            else:
-                page_map[con_hash(page.name)] = page
-
-        return page_map
+            page.updated_at = to_epoch(page.details["updated_at"])
+
+        return {
+            (
+                page.stem,
+                page.book.name if page.book else None,
+                page.chapter.name if page.chapter else None,
+            ): page
+            for page in self.pages
+        }
 
     def _build_chapter_map(self):
-        """Build a map of all client chapters"""
-        page_map = {}
-        for chapter in self.chapters:
-            if chapter.book:
-                page_map[con_hash(chapter.name + chapter.book.name)] = chapter
-
-        return page_map
-
-    def _get_temp_book_map(self):
-        """Get books from the client, but don't add to the client"""
-        books = self._get_from_client(BookstackAPIEndpoints.BOOKS)
-        return {book["name"]: book["id"] for book in books}
-
-    def _retrieve_from_client_map(self, obj: Page | Shelf | Book | Chapter):
-        """Retrieve the client version of the local object"""
-        if isinstance(obj, Page):
-            name = os.path.splitext(obj.name)[0]
-
-            if obj.chapter and obj.book:
-                return self.page_map[con_hash(name + obj.book.name + obj.chapter.name)]
-
-            return (
-                self.page_map[con_hash(name + obj.book.name)]
-                if obj.book
-                else self.page_map[con_hash(name)]
-            )
+        """Build a map of all client chapters, keyed by (name, book name)"""
+        return {
+            (chapter.name, chapter.book.name): chapter
+            for chapter in self.chapters
+            if chapter.book
+        }
 
-        if isinstance(obj, Book):
-            return (
-                self.book_map[con_hash(obj.name + obj.shelf.name)]
-                if obj.shelf
-                else self.book_map[con_hash(obj.name)]
+    def _insert_shelf(self, shelf: Shelf):
+        """Add a newly created shelf to the client without refetching everything"""
+        self.shelves.append(shelf)
+        self.shelf_map[shelf.name] = shelf
+
+    def _insert_book(self, book: Book):
+        """Add a newly created book to the client without refetching everything"""
+        self.books.append(book)
+        self.book_map[(book.name, book.shelf.name if book.shelf else None)] = book
+
+    def _insert_chapter(self, chapter: Chapter):
+        """Add a newly created chapter to the client without refetching everything"""
+        self.chapters.append(chapter)
+        if chapter.book:
+            self.chapter_map[(chapter.name, chapter.book.name)] = chapter
+
+    def _insert_page(self, page: Page):
+        """Add a newly created page to the client without refetching everything"""
+        page.updated_at = to_epoch(page.details["updated_at"])
+        self.pages.append(page)
+        self.page_map[
+            (
+                page.stem,
+                page.book.name if page.book else None,
+                page.chapter.name if page.chapter else None,
             )
+        ] = page
+
+    def _retrieve_page(self, page: Page) -> Page:
+        """Retrieve the client version of a local page"""
+        return self.page_map[
+            (
+                page.stem,
+                page.book.name if page.book else None,
+                page.chapter.name if page.chapter else None,
+            )
+        ]
+
+    def _retrieve_book(self, book: Book) -> Book:
+        """Retrieve the client version of a local book"""
+        return self.book_map[(book.name, book.shelf.name if book.shelf else None)]
 
-        if isinstance(obj, Shelf):
-            return self.shelf_map[con_hash(obj.name)]
+    def _retrieve_shelf(self, shelf: Shelf) -> Shelf:
+        """Retrieve the client version of a local shelf"""
+        return self.shelf_map[shelf.name]
 
-        if isinstance(obj, Chapter):
-            return self.chapter_map[con_hash(obj.name + obj.book.name)]
+    def _retrieve_chapter(self, chapter: Chapter) -> Chapter:
+        """Retrieve the client version of a local chapter"""
+        return self.chapter_map[(chapter.name, chapter.book.name)]
 
 
 class Bookstack(LocalClient):
     """Represents the local Bookstack notes instance"""
 
-    def __init__(self, path, excluded, verbose: bool) -> None:
+    def __init__(
+        self,
+        path,
+        excluded,
+        verbose: bool,
+        max_concurrent_uploads: int = MAX_CONCURRENT_UPLOADS,
+    ) -> None:
         self.verbose = verbose
+        # bounds requests that create or update remote items across all worker threads
+        self._upload_sem = threading.BoundedSemaphore(value=max_concurrent_uploads)
         if self.verbose:
             console.log("Building local client...")
 
@@ -161,6 +195,21 @@ class Bookstack(LocalClient):
         self.books = self.book_collector.set_books(self.shelves)
         self.chapters = self.chapter_collector.set_chapters(self.books)
         self.pages = self.page_collector.set_pages(self.books)
+        self._link_remote_pages()
+
+    def _link_remote_pages(self):
+        """Attach each local page's remote counterpart, so lookups happen once per sync"""
+        for page in self.pages:
+            try:
+                page.client_page = self.client._retrieve_page(page)
+            except KeyError:
+                page.client_page = None
+
+    def _read_pages_bulk(self, pages: List[Page]):
+        """Read the content of many local pages concurrently, caching it on each page"""
+        with ThreadPoolExecutor(max_workers=READ_WORKERS) as executor:
+            for page, content in zip(pages, executor.map(Page._get_content, pages)):
+                page.content = content
 
     def _refresh(self):
         # refresh objects
@@ -191,7 +240,12 @@ class Bookstack(LocalClient):
                 return Page(name=path_parts[2], book=book)
         return None
 
-    def delete(self, item_type: BookstackItems, item_path_str: str):
+    def delete(
+        self,
+        item_type: BookstackItems,
+        item_path_str: str,
+        retrieve: Callable | None = None,
+    ):
         """Delete item from both local Obsidian Vault and remote Bookstack instance"""
         path_parts = item_path_str.split(os.path.sep)
 
@@ -211,14 +265,20 @@ class Bookstack(LocalClient):
                     console.log(f"Deleting local directory: {local_path}")
                 shutil.rmtree(local_path)
 
+        dbf.delete_page_cache([local_path])
+
         # 2. Build a temporary object to find the remote equivalent
         lookup_obj = self._build_object_for_delete(item_type, path_parts)
         if not lookup_obj:
             console.log(f"[bold red]Error:[/bold red] Could not build object for path '{item_path_str}'")
             return
 
+        # callers deleting many items of one type can look the method up once
+        if retrieve is None:
+            retrieve = getattr(self.client, f"_retrieve_{item_type.value}")
+
         try:
-            client_obj = self.client._retrieve_from_client_map(lookup_obj)
+            client_obj = retrieve(lookup_obj)
         except KeyError:
             console.log(
                 f"[bold yellow]Warning:[/bold yellow] Could not find remote equivalent for '{item_path_str}'. It may have already been deleted."
@@ -237,32 +297,40 @@ class Bookstack(LocalClient):
         if not endpoint:
             return
 
-        class DeletionLink(DetailedBookstackLink):
-            LINK = f"{endpoint.value}/{client_obj.details['id']}"
+        link = f"{endpoint.value}/{client_obj.details['id']}"
 
         if self.verbose:
             console.log(
                 f"Deleting remote {item_type.value}: {client_obj} (id: {client_obj.details['id']})"
             )
 
-        self._delete_from_bookstack(DeletionLink.LINK)
+        self._delete_from_bookstack(link)
 
-    def _delete_from_bookstack(self, link: DetailedBookstackLink):
+    def _delete_from_bookstack(self, link: str):
         """Make a DELETE request to a Bookstack API link"""
         resp = self.client._make_request(RequestType.DELETE, link)
         return resp
 
     def sync_remote(self):
         """Sync local changes to the remote."""
-        self.shelf_collector.create_remote_missing_shelves()
+        # created items are added to the client as they come back from the
+        # remote, so later steps can look up their ids without a full refresh
+        for shelf in self.shelf_collector.create_remote_missing_shelves():
+            self.client._insert_shelf(shelf)
+
         self.missing_books = self.book_collector._create_remote_missing_books()
-        self.client._refresh()  # refresh to update book and page ids
-        self._refresh()
+        for book in self.missing_books:
+            self.client._insert_book(book)
+
         self.book_collector.update_shelf_books(self.missing_books)
-        self.client._refresh()  # refresh to update book and page ids
-        self.chapter_collector.create_remote_missing_chapters()
-        self.page_collector.create_remote_missing_pages()
-        self.client._refresh()  # refresh to include newly created pages and chapters
+
+        for chapter in self.chapter_collector.create_remote_missing_chapters():
+            self.client._insert_chapter(chapter)
+
+        for page in self.page_collector.create_remote_missing_pages():
+            self.client._insert_page(page)
+
+        self._link_remote_pages()
 
     def sync_local(self):
         """Sync any remote changes to local store"""
@@ -277,6 +345,7 @@ class Bookstack(LocalClient):
             console.log("Purging local files not found on remote...")
 
         # The order is important: from most nested to least (pages -> chapters -> books -> shelves)
+        purged = []
 
         # Purge pages
         extra_pages = self.page_collector._get_missing_set(
@@ -287,6 +356,7 @@ class Bookstack(LocalClient):
                 if self.verbose:
                     console.log(f"Purging local page: {page.path}")
                 os.remove(page.path)
+                purged.append(page.path)
 
         # Purge chapters
         extra_chapters = self.chapter_collector._get_missing_set(
@@ -297,6 +367,7 @@ class Bookstack(LocalClient):
                 if self.verbose:
                     console.log(f"Purging local chapter: {chapter.path}")
                 shutil.rmtree(chapter.path)
+                purged.append(chapter.path)
 
         # Purge books
         extra_books = self.book_collector._get_missing_set(
@@ -307,6 +378,7 @@ class Bookstack(LocalClient):
                 if self.verbose:
                     console.log(f"Purging local book: {book.path}")
                 shutil.rmtree(book.path)
+                purged.append(book.path)
 
         # Purge shelves
         extra_shelves = self.shelf_collector._get_missing_set(
@@ -317,6 +389,10 @@ class Bookstack(LocalClient):
                 if self.verbose:
                     console.log(f"Purging local shelf: {shelf.path}")
                 shutil.rmtree(shelf.path)
+                purged.append(shelf.path)
+
+        if purged:
+            dbf.delete_page_cache(purged)
 
     def purge_remote(self):
         """Deletes remote items that do not exist locally."""
@@ -333,48 +409,71 @@ class Bookstack(LocalClient):
         ]:
             collector = getattr(self, f"{item_type.value}_collector")
             extra_items = collector._get_missing_set(item_type, SyncType.LOCAL)
-            for item in extra_items:
+            retrieve = getattr(self.client, f"_retrieve_{item_type.value}")
+
+            def purge(item):
                 if self.verbose:
-                    console.log(f"Purging remote {item_type.value}: {item.get_full_path_str()}")
-                self.delete(item_type, item.get_full_path_str())
+                    console.log(f"Purging remote {item_type.value}: {item.full_path_str}")
+                self.delete(item_type, item.full_path_str, retrieve)
+
+            # items of one type are independent, so their deletes can overlap
+            self.client._map_concurrently(purge, extra_items)
 
     def update_remote(self, remote: bool, local: bool):
         """Sync page contents to the remote"""
         updated_pages = []
+        pages_to_upload = []
+        synced_pages = []
+        page_cache = dbf.select_page_cache()
 
         for page in self.pages:
-            file_stat = os.stat(page.path)
-
-            updated_at = datetime.utcfromtimestamp(file_stat.st_mtime)
-
-            try:
-                client_page = self.client._retrieve_from_client_map(page)
-                client_updated = datetime.strptime(
-                    client_page.details["updated_at"], "%Y-%m-%dT%H:%M:%S.%fZ"
-                )
-            except KeyError:
+            client_page = page.client_page
+            if client_page is None:
                 console.log(
-                    f"[bold yellow]Warning:[/bold yellow] Local page '{page.get_full_path_str()}' not found on remote. Skipping update."
+                    f"[bold yellow]Warning:[/bold yellow] Local page '{page.full_path_str}' not found on remote. Skipping update."
                 )
                 continue
 
+            # neither side has changed since the page was last synced
+            if page_cache.get(page.path) == (page.mtime, client_page.updated_at):
+                continue
+
+            # TODO: Surely there's a better way to tell the difference without downloading content
             if remote:
-                if updated_at > client_updated and (
-                    updated_at - client_updated
-                ) > timedelta(
-                    seconds=5  # TODO: Surely there's a better way to tell the difference without downloading content
-                ):
-                    updated_pages.append(client_page)
-                    self.page_collector.update_local_content(page, client_page)
+                if page.mtime - client_page.updated_at > 5:
+                    pages_to_upload.append((page, client_page))
             elif local:
-                if updated_at < client_updated and (
-                    client_updated - updated_at
-                ) > timedelta(seconds=5):
+                if client_page.updated_at - page.mtime > 5:
                     console.log(f"Updating local page: {page}")
                     updated_pages.append(page)
-                    content = self.page_collector.update(client_page)
-                    with open(page.path, "wb") as f:
-                        f.write(content)
+                    self.page_collector.update(client_page, page.path)
+
+                    synced_pages.append(
+                        (page.path, os.stat(page.path).st_mtime, client_page.updated_at)
+                    )
+
+        if pages_to_upload:
+            self._read_pages_bulk([page for page, _ in pages_to_upload])
+
+            def upload(pair):
+                page, client_page = pair
+                try:
+                    return self.page_collector.update_local_content(page, client_page)
+                finally:
+                    # drop the cached content once sent, it is not needed again
+                    page.__dict__.pop("content", None)
+
+            updated_pages.extend(client_page for _, client_page in pages_to_upload)
+            results = self.client._map_concurrently(upload, pages_to_upload)
+
+            for (page, _), details in zip(pages_to_upload, results):
+                if details:
+                    synced_pages.append(
+                        (page.path, page.mtime, to_epoch(details["updated_at"]))
+                    )
+
+        if synced_pages:
+            dbf.update_page_cache(synced_pages)
 
         if not updated_pages and self.verbose:
             console.log("No pages changed to update")
@@ -1,6 +1,8 @@
 import json
 import os
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable
 
 import urllib3
 
@@ -19,32 +21,77 @@ class RemoteClient(Client):
         self.secret = os.getenv("BOOKSTACK_TOKEN_SECRET")
         self.base_url = os.getenv("BOOKSTACK_BASE_URL")
         self.headers = {"Authorization": f"Token {self.id}:{self.secret}"}
-        self.http = urllib3.PoolManager()
+        # shared by every fan-out so concurrent requests stay within MAX_WORKERS
+        self._executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+        # created once and shared by every request, so connections are kept alive
+        self.http = urllib3.PoolManager(
+            num_pools=1, maxsize=MAX_CONNECTIONS, block=False
+        )
 
     def _make_request(
         self,
         request_type: RequestType,
-        endpoint: BookstackAPIEndpoints | DetailedBookstackLink,
+        endpoint: BookstackAPIEndpoints | DetailedBookstackLink | str,
         body=None,
         json=None,
+        fields=None,
+        headers=None,
+        preload_content=True,
     ) -> urllib3.BaseHTTPResponse:
-        """Make a HTTP request to a Bookstack API Endpoint"""
+        """Make a HTTP request to a Bookstack API Endpoint, extra headers apply to this request only"""
 
         assert self.base_url
 
-        request_url = self.base_url + endpoint.value
+        link = endpoint if isinstance(endpoint, str) else endpoint.value
+        request_url = self.base_url + link
         resp = self.http.request(
-            request_type.value, request_url, headers=self.headers, body=body, json=json
+            request_type.value,
+            request_url,
+            headers={**self.headers, **headers} if headers else self.headers,
+            body=body,
+            json=json,
+            fields=fields,
+            preload_content=preload_content,
         )
         return resp
 
-    def _get_from_client(self, endpoint: BookstackAPIEndpoints):
-        """Make a GET request to a Bookstack API Endpoint"""
-        resp = self._make_request(RequestType.GET, endpoint)
+    def _map_concurrently(self, func: Callable, items: Iterable) -> list:
+        """Apply func to each item on the client's worker threads, func must not wait on the pool itself"""
+        return list(self._executor.map(func, items))
+
+    def _get_listing(self, endpoint: BookstackAPIEndpoints, offset: int) -> dict:
+        """Make a GET request for one page of a Bookstack API listing"""
+        resp = self._make_request(
+            RequestType.GET, endpoint, fields={"count": PAGE_SIZE, "offset": offset}
+        )
         assert resp
 
-        data = json.loads(resp.data.decode())
-        return data["data"]
+        return json.loads(resp.data.decode())
+
+    def _get_from_client(self, endpoint: BookstackAPIEndpoints):
+        """Make a GET request to a Bookstack API Endpoint, fetching every page of results"""
+        # even the first page goes through the shared pool so every request counts
+        # against MAX_WORKERS, which means this must not itself run on the pool
+        listing = self._executor.submit(self._get_listing, endpoint, 0).result()
+        data = listing["data"]
+
+        offsets = range(PAGE_SIZE, listing.get("total", 0), PAGE_SIZE)
+        for page in self._map_concurrently(
+            lambda offset: self._get_listing(endpoint, offset)["data"], offsets
+        ):
+            data.extend(page)
+
+        return data
+
+    def _get_details(self, endpoint: BookstackAPIEndpoints, ids: Iterable) -> list:
+        """Concurrently GET the detailed view of each item id, None where empty"""
+
+        def get_detail(id):
+            link = f"{endpoint.value}/{id}"
+            resp = self._make_request(RequestType.GET, link).data.decode()
+            return json.loads(resp) if resp else None
+
+        return self._map_concurrently(get_detail, ids)
 
 
 class LocalClient(Client):
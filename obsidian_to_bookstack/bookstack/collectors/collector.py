@@ -1,4 +1,3 @@
-import os
 from abc import ABC, abstractmethod
 
 from ...console import console
@@ -31,22 +30,50 @@ class LocalCollector(BaseCollector):
         items = getattr(self.local, attr)
         client_items = getattr(self.client, attr)
 
-        item_names = set(os.path.splitext(item.name)[0] for item in items)
-        client_item_names = set(item.name for item in client_items)
+        # local pages are files, so compare them without their extension
+        name_attr = "stem" if item == BookstackItems.PAGE else "name"
+
+        item_names = set(getattr(i, name_attr) for i in items)
+        client_item_names = set(ci.name for ci in client_items)
 
         if sync_type == SyncType.LOCAL:
             missing = client_item_names - item_names
             missing_items = [ci for ci in client_items if ci.name in missing]
         else:
             missing = item_names - client_item_names
-            missing_items = [
-                ci for ci in items if os.path.splitext(ci.name)[0] in missing
-            ]
+            missing_items = [i for i in items if getattr(i, name_attr) in missing]
 
         return missing_items
 
+    def _create_remote(
+        self, endpoint: BookstackAPIEndpoints, body=None, json=None, headers=None
+    ) -> dict | None:
+        """POST a new item to the remote, returning its details or None on failure"""
+        resp = self.client._make_request(
+            RequestType.POST, endpoint, body=body, json=json, headers=headers
+        )
+
+        if resp.status >= 300:
+            console.log(
+                f"[bold red]Error:[/bold red] Failed to create item at {endpoint.value} (status {resp.status})"
+            )
+            return None
+
+        return resp.json()
+
 
 class RemoteCollector(BaseCollector):
     def __init__(self, verbose: bool, client: RemoteClient) -> None:
         super().__init__(verbose)
         self.client = client
+
+    def _fetch_detailed(self, endpoint: BookstackAPIEndpoints) -> list[dict]:
+        """Get every item at an endpoint, with its detailed view under "details" """
+        items = self.client._get_from_client(endpoint)
+        client_details = self.client._get_details(endpoint, [item["id"] for item in items])
+
+        for item, details in zip(items, client_details):
+            if details:
+                item["details"] = details
+
+        return items
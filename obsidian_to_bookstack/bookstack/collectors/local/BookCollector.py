@@ -28,10 +28,8 @@ class LocalBookCollector(LocalCollector):
         return books
 
     def update_shelf_books(self, missing_books: List[Book]):
-        """Update's a shelf's books array"""
-        new_books = []
+        """Add newly created remote books to their remote shelves"""
         s = {}
-        map = self.client._get_temp_book_map()
 
         for book in missing_books:
             if book.shelf not in s:
@@ -39,29 +37,28 @@ class LocalBookCollector(LocalCollector):
             else:
                 s[book.shelf].append(book)
 
-        for shelf in s:
-            new_books = []
-            for book in s[shelf]:
-                new_books.append(map[book.name])
+        for client_shelf in s:
+            new_books = [book.details["id"] for book in s[client_shelf]]
+            books = [book["id"] for book in client_shelf.client_books] + new_books
 
-            client_shelf = self.client._retrieve_from_client_map(shelf)
+            data = {
+                "name": client_shelf.details["name"],
+                "books": books,
+            }
 
-            if client_shelf:
-                books = new_books
-                if client_shelf.details.get("books"):
-                    books = client_shelf.details["books"] + new_books
-
-                data = {
-                    "name": client_shelf.details["name"],
-                    "books": books,
-                }
-
-                self.client.headers["Content-Type"] = "application/json"
-
-                class ShelfUpdate(DetailedBookstackLink):
-                    LINK = f"/api/shelves/{client_shelf.details['id']}"
+            link = f"{BookstackAPIEndpoints.SHELVES.value}/{client_shelf.details['id']}"
+            self.client._make_request(
+                RequestType.PUT,
+                link,
+                json=data,
+                headers={"Content-Type": "application/json"},
+            )
 
-                self.client._make_request(RequestType.PUT, ShelfUpdate.LINK, json=data)
+            for book in s[client_shelf]:
+                client_shelf.client_books.append(
+                    {"id": book.details["id"], "name": book.name}
+                )
+                client_shelf.books.append(book)
 
     def create_local_missing_books(self) -> None:
         """Create any missing books in the local store"""
@@ -74,22 +71,33 @@ class LocalBookCollector(LocalCollector):
             if self.verbose:
                 console.log(f"Creating a book at: {path}")
 
-    def _create_remote_missing_books(self) -> List[Book] | List:
-        """Create any books in the remote which are missing"""
+    def _create_remote_missing_books(self) -> List[Book]:
+        """Create any books in the remote which are missing, returning the created books"""
+        created = []
         missing_books = self._get_missing_set(BookstackItems.BOOK, SyncType.REMOTE)
         for book in missing_books:
             if self.verbose:
                 console.log(f"Bookstack missing book: {book}")
 
+            try:
+                client_shelf = self.client._retrieve_shelf(book.shelf)
+            except KeyError:
+                console.log(
+                    f"[bold yellow]Warning:[/bold yellow] Skipping book '{book.full_path_str}', its shelf is not on the remote."
+                )
+                continue
+
             encoded_data, content_type = urllib3.encode_multipart_formdata(
                 {"name": book.name}
             )
-            self.client.headers["Content-Type"] = content_type
-            self.client._make_request(
-                RequestType.POST, BookstackAPIEndpoints.BOOKS, body=encoded_data
+            details = self._create_remote(
+                BookstackAPIEndpoints.BOOKS,
+                body=encoded_data,
+                headers={"Content-Type": content_type},
             )
 
-        if missing_books:
-            return missing_books  # save to update shelf location
+            if details:
+                # keep the remote shelf to update its books afterwards
+                created.append(Book(details["name"], shelf=client_shelf, details=details))
 
-        return []
+        return created
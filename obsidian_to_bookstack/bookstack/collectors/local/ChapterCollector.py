@@ -3,7 +3,7 @@ from typing import List
 
 import urllib3
 
-from obsidian_to_bookstack.bookstack.artifacts import Book
+from obsidian_to_bookstack.bookstack.artifacts import Book, Chapter
 from obsidian_to_bookstack.bookstack.client import RemoteClient
 from obsidian_to_bookstack.bookstack.collectors.collector import LocalCollector
 from obsidian_to_bookstack.bookstack.constants import *
@@ -37,24 +37,42 @@ class LocalChapterCollector(LocalCollector):
                     console.log(f"Creating a chapter at: {path}")
                 os.mkdir(path)
 
-    def create_remote_missing_chapters(self):
-        """Create any chapters in the remote which are missing"""
+    def create_remote_missing_chapters(self) -> List[Chapter]:
+        """Create any chapters in the remote which are missing, returning the created chapters"""
         missing_chapters = self._get_missing_set(
             BookstackItems.CHAPTER, SyncType.REMOTE
         )
-        for chapter in missing_chapters:
-            if self.verbose:
-                console.log(f"Bookstack missing chapter: {chapter}")
+        created = self.client._map_concurrently(
+            self.__create_remote_chapter, missing_chapters
+        )
 
-            client_book = self.client._retrieve_from_client_map(chapter.book)
+        return [chapter for chapter in created if chapter]
 
-            encoded_data, content_type = urllib3.encode_multipart_formdata(
-                {"name": chapter.name, "book_id": client_book.details["id"]}
+    def __create_remote_chapter(self, chapter: Chapter) -> Chapter | None:
+        """Create a single chapter in the remote"""
+        if self.verbose:
+            console.log(f"Bookstack missing chapter: {chapter}")
+
+        try:
+            client_book = self.client._retrieve_book(chapter.book)
+        except KeyError:
+            console.log(
+                f"[bold yellow]Warning:[/bold yellow] Skipping chapter '{chapter.full_path_str}', its book is not on the remote."
             )
-            self.client.headers["Content-Type"] = content_type
-            self.client._make_request(
-                RequestType.POST, BookstackAPIEndpoints.CHAPTERS, body=encoded_data
+            return None
+
+        encoded_data, content_type = urllib3.encode_multipart_formdata(
+            {"name": chapter.name, "book_id": client_book.details["id"]}
+        )
+
+        with self.local._upload_sem:
+            details = self._create_remote(
+                BookstackAPIEndpoints.CHAPTERS,
+                body=encoded_data,
+                headers={"Content-Type": content_type},
             )
 
-        # if missing_chapters:
-        #     self.missing_books = missing_chape  # save to update shelf location
+        if details:
+            return Chapter(details["name"], book=client_book, details=details)
+
+        return None
@@ -1,4 +1,5 @@
 import os
+import shutil
 from typing import List, Type
 
 from obsidian_to_bookstack.bookstack.artifacts import Book, Page
@@ -6,11 +7,17 @@ from obsidian_to_bookstack.bookstack.client import RemoteClient
 from obsidian_to_bookstack.bookstack.collectors.collector import LocalCollector
 from obsidian_to_bookstack.bookstack.constants import *
 from obsidian_to_bookstack.console import console
+from obsidian_to_bookstack.sqllite import DatabaseFunctions as dbf
+from obsidian_to_bookstack.utils import to_epoch
 
 
 class LocalPageCollector(LocalCollector):
     """Performs operations with Pages pertaining to the local Obsidian Vault"""
 
+    # (end, inc) steps passed to __remove_header, in order
+    TITLE_HEADER = [("\n\n", True)]
+    FULL_HEADER = [("#", False), ("\n\n", True)]
+
     def __init__(
         self, local, client: RemoteClient, path: str, excluded: list, verbose: bool
     ) -> None:
@@ -29,14 +36,40 @@ class LocalPageCollector(LocalCollector):
 
         return pages
 
-    def __download_content(self, page):
-        """Download content from item in remote instance"""
-
-        class PageMarkdownLink(DetailedBookstackLink):
-            LINK = f"/api/pages/{page.details['id']}/export/markdown"
-
-        content = self.client._make_request(RequestType.GET, PageMarkdownLink.LINK)
-        return content.data
+    def __download_to(self, page, path, header):
+        """Stream an item's markdown export from the remote into path, without its header"""
+
+        link = f"{BookstackAPIEndpoints.PAGES.value}/{page.details['id']}/export/markdown"
+        resp = self.client._make_request(RequestType.GET, link, preload_content=False)
+
+        # write next to the target and swap it in only once the whole export has
+        # arrived, so a dropped connection never leaves a truncated note behind
+        tmp_path = f"{path}.part"
+        try:
+            with open(tmp_path, "wb") as f:
+                chunks = resp.stream(CHUNK_SIZE)
+
+                # hold on to content until the header can be removed, which is
+                # the whole export if it never contains every header marker
+                head = bytearray()
+                for chunk in chunks:
+                    head.extend(chunk)
+                    if self.__header_complete(head, header):
+                        break
+
+                f.write(self.__remove_headers(head, header))
+                for chunk in chunks:
+                    f.write(chunk)
+
+            if os.path.exists(path):
+                shutil.copymode(path, tmp_path)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        finally:
+            resp.release_conn()
 
     def __remove_header(self, content, end, inc=False):  # oof
         first_index = content.find(b"#")
@@ -52,16 +85,25 @@ class LocalPageCollector(LocalCollector):
         else:
             return content
 
-    def __remove_full_header(self, content):
-        content = self.__remove_header(content, "#")
-        content = self.__remove_header(content, "\n\n", inc=True)
+    def __remove_headers(self, content, header):
+        for end, inc in header:
+            content = self.__remove_header(content, end, inc=inc)
         return content
 
+    def __header_complete(self, content, header):
+        """Whether every header marker is in content, so later chunks can't change the result"""
+        for end, inc in header:
+            first_index = content.find(b"#")
+            if first_index == -1 or content.find(end.encode(), first_index + 1) == -1:
+                return False
+            content = self.__remove_header(content, end, inc=inc)
+        return True
+
     def create_local_missing_pages(self):
         """Create any missing pages in the local store, and write content to files which are missing."""
+        synced_pages = []
         missing_pages = self._get_missing_set(BookstackItems.PAGE, SyncType.LOCAL)
         for page in missing_pages:
-            content = self.__download_content(page)
             path_components = [self.path, page.book.shelf.name, page.book.name]
 
             if page.chapter:
@@ -71,60 +113,92 @@ class LocalPageCollector(LocalCollector):
 
             path = os.path.join(*path_components)
 
-            if content is not None:
-                if self.verbose:
-                    console.log(f"Creating a page at: {path}")
+            if self.verbose:
+                console.log(f"Creating a page at: {path}")
 
-                with open(path, "wb") as f:
-                    content = self.__remove_header(content, "\n\n", inc=True)
-                    f.write(content)
+            self.__download_to(page, path, self.TITLE_HEADER)
 
-    def create_remote_missing_pages(self):
-        """Create any pages in the remote which are missing"""
-        missing_pages = self._get_missing_set(BookstackItems.PAGE, SyncType.REMOTE)
-        for page in missing_pages:
-            if self.verbose:
-                console.log(f"Bookstack missing page: {page}")
+            synced_pages.append((path, os.stat(path).st_mtime, page.updated_at))
 
-            client_book = self.client._retrieve_from_client_map(page.book)
+        if synced_pages:
+            dbf.update_page_cache(synced_pages)
 
-            client_chapter = None
+    def create_remote_missing_pages(self) -> List[Page]:
+        """Create any pages in the remote which are missing, returning the created pages"""
+        missing_pages = self._get_missing_set(BookstackItems.PAGE, SyncType.REMOTE)
 
-            if page.chapter:
-                client_chapter = self.client._retrieve_from_client_map(page.chapter)
+        created = self.client._map_concurrently(
+            self.__create_remote_page, missing_pages
+        )
 
-            book_id = client_book.details["id"]
+        synced_pages = [
+            (page.path, page.mtime, to_epoch(client_page.details["updated_at"]))
+            for page, client_page in zip(missing_pages, created)
+            if client_page
+        ]
+        if synced_pages:
+            dbf.update_page_cache(synced_pages)
 
-            content = ""
+        return [page for page in created if page]
 
-            with open(page.path, "r") as f:
-                content = str(f.read())
+    def __create_remote_page(self, page: Page) -> Page | None:
+        """Create a single page in the remote"""
+        if self.verbose:
+            console.log(f"Bookstack missing page: {page}")
 
-            data = {
-                "book_id": book_id,
-                "name": os.path.splitext(page.name)[0],
-                "markdown": content,
-            }
+        try:
+            client_book = self.client._retrieve_book(page.book)
 
-            if client_chapter:
-                data["chapter_id"] = client_chapter.details["id"]
+            client_chapter = None
+
+            if page.chapter:
+                client_chapter = self.client._retrieve_chapter(page.chapter)
+        except KeyError:
+            console.log(
+                f"[bold yellow]Warning:[/bold yellow] Skipping page '{page.full_path_str}', its book or chapter is not on the remote."
+            )
+            return None
+
+        book_id = client_book.details["id"]
+
+        data = {
+            "book_id": book_id,
+            "name": page.stem,
+            "markdown": page.content,
+        }
+        # the request body holds the content now, don't keep a second copy cached
+        page.__dict__.pop("content", None)
+
+        if client_chapter:
+            data["chapter_id"] = client_chapter.details["id"]
+
+        with self.local._upload_sem:
+            details = self._create_remote(
+                BookstackAPIEndpoints.PAGES,
+                json=data,
+                headers={"Content-Type": "application/json"},
+            )
 
-            self.client.headers["Content-Type"] = "application/json"
-            self.client._make_request(
-                RequestType.POST, BookstackAPIEndpoints.PAGES, json=data
+        if details:
+            return Page(
+                details["name"],
+                book=client_book,
+                chapter=client_chapter,
+                details=details,
             )
 
-    def update_local_content(self, page: Page, client_page: Page):
-        """Update the content of a page in the remote"""
-        assert page.book
+        return None
 
-        client_book = self.client._retrieve_from_client_map(page.book)
-        client_chapter = self.client._retrieve_from_client_map(page.chapter)
+    def update_local_content(self, page: Page, client_page: Page) -> dict | None:
+        """Update the content of a page in the remote, returning its new details"""
+        assert page.book
 
-        content = None
+        client_book = self.client._retrieve_book(page.book)
+        client_chapter = (
+            self.client._retrieve_chapter(page.chapter) if page.chapter else None
+        )
 
-        with open(page.path, "r") as f:
-            content = "".join(f.readlines()[0:])  # remove header
+        content = page.content
 
         if content:
             if self.verbose:
@@ -132,19 +206,28 @@ class LocalPageCollector(LocalCollector):
 
             data = {
                 "book_id": client_book.details["id"],
-                "name": os.path.splitext(page.name)[0],
+                "name": page.stem,
                 "markdown": content,
             }
 
             if client_chapter:
                 data["chapter_id"] = client_chapter.details["id"]
 
-            class PageLink(DetailedBookstackLink):
-                LINK = f"/api/pages/{client_page.details['id']}"
+            link = f"{BookstackAPIEndpoints.PAGES.value}/{client_page.details['id']}"
+
+            with self.local._upload_sem:
+                resp = self.client._make_request(
+                    RequestType.PUT,
+                    link,
+                    json=data,
+                    headers={"Content-Type": "application/json"},
+                )
+
+            if resp.status < 300:
+                return resp.json()
 
-            self.client._make_request(RequestType.PUT, PageLink.LINK, json=data)
+        return None
 
-    def update(self, client_page: Page):
-        """Downloads and removes full header"""
-        content = self.__download_content(client_page)
-        return self.__remove_full_header(content)
+    def update(self, client_page: Page, path: str):
+        """Downloads into path and removes full header"""
+        self.__download_to(client_page, path, self.FULL_HEADER)
@@ -1,4 +1,5 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 
 import urllib3
@@ -21,16 +22,35 @@ class LocalShelfCollector(LocalCollector):
     def set_shelves(self) -> List[Shelf]:
         """Set shelves from Obsidian Vault local directory"""
         shelves = []
-        for shelf in os.listdir(self.path):
-            if os.path.isdir(os.path.join(self.path, shelf)) and shelf != ".obsidian":
-                if not shelf.startswith(".") and shelf not in self.excluded:
-                    s = Shelf(
-                        path=os.path.join(self.path, shelf),
-                        name=shelf,
-                        client=self.client,
-                        from_client=False,
-                    )
-                    shelves.append(s)
+        book_futures = []
+
+        # books of every shelf are scanned concurrently, the GIL is released
+        # while listing directories; shelves only list their book directories
+        with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as executor:
+            with os.scandir(self.path) as entries:
+                for entry in entries:
+                    if (
+                        entry.is_dir()
+                        and not entry.name.startswith(".")
+                        and entry.name not in self.excluded
+                    ):
+                        # the shelf's books are built below on the executor,
+                        # not serially by the shelf itself
+                        s = Shelf(
+                            path=entry.path,
+                            name=entry.name,
+                            client=self.client,
+                            from_client=False,
+                            scan_books=False,
+                        )
+                        shelves.append(s)
+                        book_futures.extend(
+                            (s, executor.submit(s._build_book, book_entry))
+                            for book_entry in s._book_entries()
+                        )
+
+            for shelf, future in book_futures:
+                shelf.books.append(future.result())
 
         return shelves
 
@@ -44,8 +64,9 @@ class LocalShelfCollector(LocalCollector):
             if self.verbose:
                 console.log(f"Creating a shelf at: {path}")
 
-    def create_remote_missing_shelves(self):
-        """Create any shelves in the remote which are missing"""
+    def create_remote_missing_shelves(self) -> List[Shelf]:
+        """Create any shelves in the remote which are missing, returning the created shelves"""
+        created = []
         missing_shelves = self._get_missing_set(BookstackItems.SHELF, SyncType.REMOTE)
         for shelf in missing_shelves:
             if self.verbose:
@@ -54,7 +75,15 @@ class LocalShelfCollector(LocalCollector):
             encoded_data, content_type = urllib3.encode_multipart_formdata(
                 {"name": shelf.name}
             )
-            self.client.headers["Content-Type"] = content_type
-            self.client._make_request(
-                RequestType.POST, BookstackAPIEndpoints.SHELVES, body=encoded_data
+            details = self._create_remote(
+                BookstackAPIEndpoints.SHELVES,
+                body=encoded_data,
+                headers={"Content-Type": content_type},
             )
+
+            if details:
+                s = Shelf(details["name"], details=details)
+                s.client_books = s.details.pop("books", [])
+                created.append(s)
+
+        return created
@@ -1,4 +1,3 @@
-import json
 from typing import List
 
 from obsidian_to_bookstack.bookstack.artifacts import Book, Shelf
@@ -7,40 +6,28 @@ from obsidian_to_bookstack.bookstack.collectors.collector import \
     RemoteCollector
 from obsidian_to_bookstack.bookstack.constants import *
 from obsidian_to_bookstack.console import console
-from obsidian_to_bookstack.utils import con_hash
 
 
 class RemoteBookCollector(RemoteCollector):
     def __init__(self, verbose: bool, client: RemoteClient) -> None:
         super().__init__(verbose, client)
 
-    def get_books(self, shelves: List[Shelf]):
-        """Get remote books from shelves"""
-        client_books = self.client._get_from_client(BookstackAPIEndpoints.BOOKS)
-
-        for book in client_books:
-
-            class DetailedBook(DetailedBookstackLink):
-                LINK = f"/api/books/{book['id']}"
+    def fetch_books(self):
+        """Request the remote's books along with their details"""
+        return self._fetch_detailed(BookstackAPIEndpoints.BOOKS)
 
-            details = json.loads(
-                self.client._make_request(
-                    RequestType.GET,
-                    DetailedBook.LINK,
-                ).data.decode()
-            )
-
-            book["details"] = details
+    def get_books(self, shelves: List[Shelf], client_books=None):
+        """Get remote books from shelves"""
+        if client_books is None:
+            client_books = self.fetch_books()
 
         books = [Book(book["name"], details=book["details"]) for book in client_books]
 
-        BOOK_MAP = {
-            con_hash(book.name + str(book.details["id"])): book for book in books
-        }
+        BOOK_MAP = {(book.name, book.details["id"]): book for book in books}
 
         for shelf in shelves:
             for book in shelf.client_books:
-                b = BOOK_MAP.get(con_hash(book["name"] + str(book["id"])))
+                b = BOOK_MAP.get((book["name"], book["id"]))
                 if b:
                     b.shelf = shelf
                     shelf.books.append(b)
@@ -1,4 +1,3 @@
-import json
 from typing import List
 
 from obsidian_to_bookstack.bookstack.artifacts import (Book, Chapter, Page,
@@ -8,29 +7,17 @@ from obsidian_to_bookstack.bookstack.collectors.collector import \
     RemoteCollector
 from obsidian_to_bookstack.bookstack.constants import *
 from obsidian_to_bookstack.console import console
-from obsidian_to_bookstack.utils import con_hash
 
 
 class RemoteChapterCollector(RemoteCollector):
-    def get_chapters(self, books: List[Book]):
-        """Get remote chapters from books"""
-        client_chapters = self.client._get_from_client(BookstackAPIEndpoints.CHAPTERS)
-
-        for chapter in client_chapters:
-
-            class DetailedChapter(DetailedBookstackLink):
-                LINK = f"/api/chapters/{chapter['id']}"
+    def fetch_chapters(self):
+        """Request the remote's chapters along with their details"""
+        return self._fetch_detailed(BookstackAPIEndpoints.CHAPTERS)
 
-            resp = self.client._make_request(
-                RequestType.GET,
-                DetailedChapter.LINK,
-            ).data.decode()
-
-            if resp:
-                details = json.loads(resp)
-
-                if details:
-                    chapter["details"] = details
+    def get_chapters(self, books: List[Book], client_chapters=None):
+        """Get remote chapters from books"""
+        if client_chapters is None:
+            client_chapters = self.fetch_chapters()
 
         chapters = [
             Chapter(chapter["name"], details=chapter["details"])
@@ -38,15 +25,14 @@ class RemoteChapterCollector(RemoteCollector):
         ]
 
         CHAPTER_MAP = {
-            con_hash(chapter.name + str(chapter.details["id"])): chapter
-            for chapter in chapters
+            (chapter.name, chapter.details["id"]): chapter for chapter in chapters
         }
 
         for book in books:
             if book.details.get("contents"):
                 for item in book.details["contents"]:
                     if item["type"] == "chapter":
-                        c = CHAPTER_MAP.get(con_hash(item["name"] + str(item["id"])))
+                        c = CHAPTER_MAP.get((item["name"], item["id"]))
                         if c:
                             c.book = book
                             book.chapters.append(c)
@@ -1,4 +1,3 @@
-import json
 from typing import List
 
 from obsidian_to_bookstack.bookstack.artifacts import Book, Page, Shelf
@@ -7,45 +6,30 @@ from obsidian_to_bookstack.bookstack.collectors.collector import \
     RemoteCollector
 from obsidian_to_bookstack.bookstack.constants import *
 from obsidian_to_bookstack.console import console
-from obsidian_to_bookstack.utils import con_hash
 
 
 class RemotePageCollector(RemoteCollector):
     def __init__(self, verbose: bool, client: RemoteClient) -> None:
         super().__init__(verbose, client)
 
+    def fetch_pages(self):
+        """Request the remote's pages along with their details"""
+        return self._fetch_detailed(BookstackAPIEndpoints.PAGES)
+
     def get_pages(self, books: List[Book], client_pages=None):
         """Get remote pages from books"""
-        if not client_pages:
-            client_pages = self.client._get_from_client(BookstackAPIEndpoints.PAGES)
-
-        for page in client_pages:
-
-            class DetailedPage(DetailedBookstackLink):
-                LINK = f"/api/pages/{page['id']}"
-
-            resp = self.client._make_request(
-                RequestType.GET,
-                DetailedPage.LINK,
-            ).data.decode()
-
-            if resp:
-                details = json.loads(resp)
-
-                if details:
-                    page["details"] = details
+        if client_pages is None:
+            client_pages = self.fetch_pages()
 
         pages = [Page(page["name"], details=page["details"]) for page in client_pages]
 
-        PAGE_MAP = {
-            con_hash(page.name + str(page.details["id"])): page for page in pages
-        }
+        PAGE_MAP = {(page.name, page.details["id"]): page for page in pages}
 
         for book in books:
             if book.details.get("contents"):
                 for item in book.details["contents"]:
                     if item["type"] == "page":
-                        p = PAGE_MAP.get(con_hash(item["name"] + str(item["id"])))
+                        p = PAGE_MAP.get((item["name"], item["id"]))
                         if p:
                             p.book = book
                             book.pages.append(p)
@@ -55,7 +39,7 @@ class RemotePageCollector(RemoteCollector):
 
                     if item["type"] == "chapter":
                         for page in item.get("pages"):
-                            p = PAGE_MAP.get(con_hash(page["name"] + str(page["id"])))
+                            p = PAGE_MAP.get((page["name"], page["id"]))
                             if p:
                                 p.book = book
                                 book.pages.append(p)
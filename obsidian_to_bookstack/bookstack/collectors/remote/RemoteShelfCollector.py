@@ -1,5 +1,3 @@
-import json
-
 from obsidian_to_bookstack.bookstack.artifacts import Shelf
 from obsidian_to_bookstack.bookstack.client import RemoteClient
 from obsidian_to_bookstack.bookstack.collectors.collector import \
@@ -12,25 +10,19 @@ class RemoteShelfCollector(RemoteCollector):
     def __init__(self, verbose: bool, client: RemoteClient) -> None:
         super().__init__(verbose, client)
 
-    def get_shelves(self):
+    def fetch_shelves(self):
+        """Request the remote's shelves along with their details"""
+        return self._fetch_detailed(BookstackAPIEndpoints.SHELVES)
+
+    def get_shelves(self, client_shelves=None):
         """Gather remote's shelves and add detailed information"""
-        client_shelves = self.client._get_from_client(BookstackAPIEndpoints.SHELVES)
+        if client_shelves is None:
+            client_shelves = self.fetch_shelves()
 
         shelves = []
 
         for shelf in client_shelves:
-
-            class DetailedShelf(DetailedBookstackLink):
-                SHELF = f"/api/shelves/{shelf['id']}"
-
-            details = json.loads(
-                self.client._make_request(
-                    RequestType.GET,
-                    DetailedShelf.SHELF,
-                ).data.decode()
-            )
-
-            s = Shelf(shelf["name"], details=details)
+            s = Shelf(shelf["name"], details=shelf["details"])
             s.client_books = s.details.pop("books")
             shelves.append(s)
 
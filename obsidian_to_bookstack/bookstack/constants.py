@@ -1,3 +1,4 @@
+import os
 from enum import Enum
 
 
@@ -38,6 +39,27 @@ BOOKSTACK_ATTR_MAP = {
     BookstackItems.CHAPTER: "chapters",
 }
 
+# Bound on concurrent requests made against the Bookstack API
+MAX_WORKERS = 8
+
+# Default bound on concurrent uploads, overridable with `wiki.max_concurrent_uploads`
+MAX_CONCURRENT_UPLOADS = 6
+
+# Size of the keep-alive connection pool to the Bookstack instance
+MAX_CONNECTIONS = 16
+
+# Bound on concurrent reads of local page files
+READ_WORKERS = 16
+
+# Bound on concurrent directory scans of the local vault
+SCAN_WORKERS = (os.cpu_count() or 1) * 2
+
+# Bytes read at a time when streaming page exports to disk
+CHUNK_SIZE = 64 * 1024
+
+# Number of items requested per page from listing endpoints (Bookstack max is 500)
+PAGE_SIZE = 500
+
 __all__ = [
     "BookstackAPIEndpoints",
     "DetailedBookstackLink",
@@ -45,4 +67,11 @@ __all__ = [
     "RequestType",
     "SyncType",
     "BOOKSTACK_ATTR_MAP",
+    "MAX_WORKERS",
+    "MAX_CONNECTIONS",
+    "MAX_CONCURRENT_UPLOADS",
+    "PAGE_SIZE",
+    "READ_WORKERS",
+    "SCAN_WORKERS",
+    "CHUNK_SIZE",
 ]
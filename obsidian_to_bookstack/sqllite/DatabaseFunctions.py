@@ -31,6 +31,21 @@ def create_settings_if_not_exists():
     conn.close()
 
 
+def create_page_cache_if_not_exists():
+    make_data_folder()
+    conn, cursor = connect()
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS page_cache (
+            path TEXT PRIMARY KEY,
+            local_mtime REAL,
+            remote_updated_at REAL
+        );
+        """
+    )
+    conn.close()
+
+
 def select_config() -> str | None:
     conn, cursor = connect()
     cursor.execute(
@@ -93,5 +108,48 @@ def update_env(env: str):
     conn.close()
 
 
+def select_page_cache() -> dict[str, tuple[float, float]]:
+    conn, cursor = connect()
+    cursor.execute(
+        """
+        SELECT path, local_mtime, remote_updated_at FROM page_cache;
+        """
+    )
+    cache = {
+        path: (local_mtime, remote_updated_at)
+        for path, local_mtime, remote_updated_at in cursor.fetchall()
+    }
+    conn.close()
+    return cache
+
+
+def update_page_cache(entries: list[tuple[str, float, float]]):
+    conn, cursor = connect()
+    cursor.executemany(
+        """
+        INSERT OR REPLACE INTO page_cache (path, local_mtime, remote_updated_at)
+        VALUES (?, ?, ?);
+        """,
+        entries,
+    )
+    conn.commit()
+    conn.close()
+
+
+def delete_page_cache(paths: list[str]):
+    conn, cursor = connect()
+    # a path may be a page file or a directory holding pages
+    cursor.executemany(
+        """
+        DELETE FROM page_cache
+        WHERE path = ? OR substr(path, 1, ?) = ?;
+        """,
+        [(path, len(path) + len(os.sep), path + os.sep) for path in paths],
+    )
+    conn.commit()
+    conn.close()
+
+
 def init_db():
     create_settings_if_not_exists()
+    create_page_cache_if_not_exists()
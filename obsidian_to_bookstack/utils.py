@@ -1,14 +1,17 @@
-import hashlib
 from collections.abc import Callable
+from datetime import datetime, timezone
 
 from .console import console
 
 
-def con_hash(key: str) -> int:
-    """Get a consistent hash of a key"""
-    hash_obj = hashlib.md5(key.encode())
-    hex_digest = hash_obj.hexdigest()
-    return int(hex_digest, 16)
+def to_epoch(timestamp: str) -> float:
+    """Convert a Bookstack UTC timestamp into epoch seconds"""
+    # fromisoformat only accepts a trailing "Z" from Python 3.11
+    return (
+        datetime.fromisoformat(timestamp.removesuffix("Z"))
+        .replace(tzinfo=timezone.utc)
+        .timestamp()
+    )
 
 
 def with_status(func: Callable, status_message: str):